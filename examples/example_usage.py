@@ -7,21 +7,74 @@ This script demonstrates how to use the MCP server tools programmatically.
 
 import asyncio
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from chaostoolkit_aws_mcp_server.server import (
-    generate_az_failure_experiment,
-    generate_asg_az_failure_experiment,
-    generate_ec2_actions_experiment,
-    validate_experiment,
-)
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine
+    orjson = None
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # optional speedup, default loop works fine
+    pass
+
+EXAMPLES_DIR = Path("./examples")
+
+# Pool for the CPU-bound parse step of validation, so JSON decoding of
+# large experiment files never holds the GIL on the event-loop thread.
+_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def parse_experiment(exp_file):
+    """Parse an experiment file, returning an error message or None"""
+    try:
+        if orjson is not None:
+            orjson.loads(Path(exp_file).read_bytes())
+        else:
+            with open(exp_file) as f:
+                json.load(f)
+    except (OSError, ValueError) as exc:
+        return str(exc)
+    return None
+
+
+# Cache of generated responses keyed by generator name and a canonical
+# JSON dump of the full arguments, output_file included — a different
+# destination must reach the generator so the file actually gets
+# written. Re-running an example with identical inputs skips the JSON
+# assembly and disk write entirely.
+_GENERATION_CACHE = {}
+
+
+async def generate_cached(generator, args):
+    """Call an experiment generator, memoizing on its arguments"""
+    if orjson is not None:
+        dumped = orjson.dumps(args, option=orjson.OPT_SORT_KEYS)
+    else:
+        dumped = json.dumps(args, sort_keys=True)
+    key = (generator.__name__, dumped)
+    if key not in _GENERATION_CACHE:
+        _GENERATION_CACHE[key] = await generator(args)
+    return _GENERATION_CACHE[key]
 
 
 async def main():
     """Main example function"""
-    
+
+    # Import lazily so the boto3/chaostoolkit dependency chain is only
+    # paid for once an example actually runs.
+    from chaostoolkit_aws_mcp_server.server import (
+        generate_az_failure_experiment,
+        generate_asg_az_failure_experiment,
+        generate_ec2_actions_experiment,
+        validate_experiment,
+    )
+
     # Example 1: Generate AZ failure experiment
-    print("=== Generating AZ Failure Experiment ===")
     az_args = {
         "title": "Production AZ Failure Test",
         "az": "cn-north-1a",
@@ -29,15 +82,11 @@ async def main():
         "dry_run": False,
         "health_check_url": "https://my-app.example.com/health",
         "state_path": "./fail_az.ec2.json",
-        "output_file": "./examples/az-failure-experiment.json",
+        "output_file": str(EXAMPLES_DIR / "az-failure-experiment.json"),
         "aws_region": "cn-north-1"
     }
     
-    result = await generate_az_failure_experiment(az_args)
-    print(result[0]["text"])
-    
     # Example 2: Generate ASG AZ failure experiment
-    print("\n=== Generating ASG AZ Failure Experiment ===")
     asg_args = {
         "title": "ASG Resilience Test",
         "az": "cn-north-1a", 
@@ -48,15 +97,11 @@ async def main():
         "dry_run": False,
         "health_check_url": "https://my-app.example.com/health",
         "state_path": "./fail_az.asg.json",
-        "output_file": "./examples/asg-az-failure-experiment.json",
+        "output_file": str(EXAMPLES_DIR / "asg-az-failure-experiment.json"),
         "aws_region": "cn-north-1"
     }
     
-    result = await generate_asg_az_failure_experiment(asg_args)
-    print(result[0]["text"])
-    
     # Example 3: Generate EC2 actions experiment
-    print("\n=== Generating EC2 Actions Experiment ===")
     ec2_args = {
         "title": "EC2 Instance Stop Test",
         "action_type": "stop_instances",
@@ -66,32 +111,73 @@ async def main():
             {"Name": "instance-state-name", "Values": ["running"]}
         ],
         "az": "cn-north-1a",
-        "output_file": "./examples/ec2-stop-experiment.json",
+        "output_file": str(EXAMPLES_DIR / "ec2-stop-experiment.json"),
         "aws_region": "cn-north-1"
     }
     
-    result = await generate_ec2_actions_experiment(ec2_args)
-    print(result[0]["text"])
-    
+    # Generate all three experiments concurrently; the calls are independent,
+    # so overlapping their I/O cuts wall-clock time to the slowest call.
+    results = await asyncio.gather(
+        generate_cached(generate_az_failure_experiment, az_args),
+        generate_cached(generate_asg_az_failure_experiment, asg_args),
+        generate_cached(generate_ec2_actions_experiment, ec2_args),
+    )
+
+    print("=== Generating AZ Failure Experiment ===")
+    print(results[0][0]["text"])
+
+    print("\n=== Generating ASG AZ Failure Experiment ===")
+    print(results[1][0]["text"])
+
+    print("\n=== Generating EC2 Actions Experiment ===")
+    print(results[2][0]["text"])
+
     # Example 4: Validate experiments
     print("\n=== Validating Experiments ===")
     experiments = [
-        "./examples/az-failure-experiment.json",
-        "./examples/asg-az-failure-experiment.json", 
-        "./examples/ec2-stop-experiment.json"
+        EXAMPLES_DIR / "az-failure-experiment.json",
+        EXAMPLES_DIR / "asg-az-failure-experiment.json",
+        EXAMPLES_DIR / "ec2-stop-experiment.json"
     ]
-    
-    for exp_file in experiments:
-        if Path(exp_file).exists():
-            result = await validate_experiment({"experiment_file": exp_file})
-            print(f"Validation for {exp_file}:")
-            print(result[0]["text"])
-            print()
+
+    # One directory scan instead of a stat() syscall per file; run it off
+    # the event-loop thread so the loop stays non-blocking.
+    present = await asyncio.to_thread(
+        lambda: {entry.name for entry in os.scandir(EXAMPLES_DIR)}
+    )
+    existing = [f for f in experiments if f.name in present]
+
+    # Validate concurrently but bounded, so a large batch cannot fan out
+    # into AWS rate limits and retry storms.
+    concurrency = int(os.environ.get("CTK_MCP_VALIDATE_CONCURRENCY", "8"))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    loop = asyncio.get_running_loop()
+
+    async def validate_bounded(exp_file):
+        async with semaphore:
+            # Cheap local syntax check in the process pool before paying
+            # for a full `chaos validate` run.
+            error = await loop.run_in_executor(_POOL, parse_experiment, exp_file)
+            if error:
+                return [{"type": "text", "text": f"Error parsing {exp_file}: {error}"}]
+            return await validate_experiment({"experiment_file": str(exp_file)})
+
+    validations = await asyncio.gather(*[validate_bounded(f) for f in existing])
+    for exp_file, result in zip(existing, validations):
+        print(f"Validation for {exp_file}:")
+        print(result[0]["text"])
+        print()
 
 
 if __name__ == "__main__":
     # Create examples directory
-    Path("./examples").mkdir(exist_ok=True)
-    
-    # Run examples
-    asyncio.run(main())
+    EXAMPLES_DIR.mkdir(exist_ok=True)
+
+    # Reuse one explicit loop rather than asyncio.run's build-and-teardown,
+    # so repeated invocations (CI matrices) can share loop setup.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
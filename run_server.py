@@ -2,15 +2,10 @@
 """
 Quick start script for Chaos Toolkit AWS MCP Server
 
-This script can be used to test the server locally or run it directly.
+Prefer the installed ``chaostoolkit-aws-mcp-server`` console script; this
+wrapper exists only for running the server straight from a checkout.
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path for local development
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from chaostoolkit_aws_mcp_server.server import main
 
 if __name__ == "__main__":
@@ -1,3 +1,16 @@
 """Chaos Toolkit AWS MCP Server"""
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    """Lazily forward attribute access to the server module (PEP 562)
+
+    Keeps ``import chaostoolkit_aws_mcp_server`` cheap by deferring the
+    server import, and with it the AWS SDK chain, until a server symbol
+    is actually requested.
+    """
+    import importlib
+
+    module = importlib.import_module("chaostoolkit_aws_mcp_server.server")
+    return getattr(module, name)
@@ -7,985 +7,1147 @@ for AWS infrastructure, including AZ failure simulation, EC2 chaos, ASG scaling,
 and other AWS chaos engineering scenarios.
 """
 
+import asyncio
+import functools
 import json
 import os
-import subprocess
-import tempfile
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
+import msgspec
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool
-from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine
+    orjson = None
 
-class ExperimentConfig(BaseModel):
+try:
+    import fastjsonschema
+except ImportError:  # optional speedup, MCP-side validation still applies
+    fastjsonschema = None
+
+
+# Shared singletons for the type tags that appear in every probe/action
+# and provider dict, so large experiments reference one object per
+# literal instead of allocating duplicates.
+_TYPE_PYTHON = sys.intern("python")
+_TYPE_PROBE = sys.intern("probe")
+_TYPE_ACTION = sys.intern("action")
+
+
+# The config classes are plain typed holders (no validators), so
+# msgspec.Struct is used over pydantic.BaseModel: construction is an
+# order of magnitude cheaper and instances are slotted.
+class ExperimentConfig(msgspec.Struct, kw_only=True):
     """Configuration for chaos experiments"""
     title: str
     description: str = ""
     aws_region: str = "us-east-1"
-    tags: List[str] = []
+    tags: List[str] = msgspec.field(default_factory=list)
 
 
-class ProbeConfig(BaseModel):
+class ProbeConfig(msgspec.Struct, kw_only=True):
     """Configuration for steady state probes"""
     name: str
-    type: str = "probe"
+    type: str = _TYPE_PROBE
     module: str
     func: str
-    arguments: Dict[str, Any]
+    arguments: Dict[str, Any] = msgspec.field(default_factory=dict)
     tolerance: Any = True
 
 
-class ActionConfig(BaseModel):
+class ActionConfig(msgspec.Struct, kw_only=True):
     """Configuration for chaos actions"""
     name: str
-    type: str = "action"
+    type: str = _TYPE_ACTION
     module: str
     func: str
-    arguments: Dict[str, Any]
+    arguments: Dict[str, Any] = msgspec.field(default_factory=dict)
 
 
 # Initialize the MCP server
 server = Server("chaostoolkit-aws-mcp-server")
 
 
-def generate_experiment_json(
+# Typed experiment tree: msgspec's C encoder walks these structs
+# directly to JSON, so no intermediate dict-of-dicts is allocated for
+# the serialized document.
+class Provider(msgspec.Struct, kw_only=True):
+    """Python provider block of a probe, action or rollback"""
+    type: str = _TYPE_PYTHON
+    module: str
+    func: str
+    arguments: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class Probe(msgspec.Struct, kw_only=True):
+    """A steady-state probe entry"""
+    type: str
+    name: str
+    provider: Provider
+    tolerance: Any = True
+
+
+class MethodStep(msgspec.Struct, kw_only=True):
+    """A single action or rollback entry"""
+    type: str
+    name: str
+    provider: Provider
+
+
+class SteadyState(msgspec.Struct, kw_only=True):
+    """Steady-state hypothesis block"""
+    title: str
+    probes: List[Probe] = msgspec.field(default_factory=list)
+
+
+class Experiment(
+    msgspec.Struct,
+    kw_only=True,
+    rename={"steady_state_hypothesis": "steady-state-hypothesis"},
+):
+    """A complete Chaos Toolkit experiment document"""
+    version: str = "1.0.0"
+    title: str
+    description: str = ""
+    tags: List[str] = msgspec.field(default_factory=list)
+    configuration: Dict[str, Any] = msgspec.field(default_factory=dict)
+    steady_state_hypothesis: SteadyState
+    method: List[MethodStep] = msgspec.field(default_factory=list)
+    rollbacks: List[MethodStep] = msgspec.field(default_factory=list)
+
+
+_STEADY_STATE_TITLE = "System is in steady state"
+
+
+def _encode_experiment(experiment) -> bytes:
+    """Serialize an experiment document to compact JSON bytes
+
+    The on-disk copy is consumed programmatically by chaos-toolkit, so
+    it is written without indentation; only the human preview in the
+    response is pretty-printed (see _write_and_respond).
+    """
+    if isinstance(experiment, Experiment):
+        return msgspec.json.encode(experiment)
+    if orjson is not None:
+        return orjson.dumps(experiment)
+    return json.dumps(experiment, separators=(",", ":")).encode()
+
+
+def _provider(item) -> Provider:
+    """Build the python provider shared by probes, actions and rollbacks"""
+    return Provider(module=item.module, func=item.func, arguments=item.arguments)
+
+
+def _build_experiment(
     config: ExperimentConfig,
     probes: List[ProbeConfig],
     actions: List[ActionConfig],
     rollbacks: List[ActionConfig]
-) -> Dict[str, Any]:
-    """Generate a complete Chaos Toolkit experiment JSON"""
-    
-    experiment = {
-        "version": "1.0.0",
-        "title": config.title,
-        "description": config.description,
-        "tags": config.tags,
-        "configuration": {
+) -> Experiment:
+    """Build the typed experiment tree from config objects"""
+
+    return Experiment(
+        title=config.title,
+        description=config.description,
+        tags=config.tags,
+        configuration={
             "aws_region": config.aws_region
         },
-        "steady-state-hypothesis": {
-            "title": "System is in steady state",
-            "probes": [
-                {
-                    "type": probe.type,
-                    "name": probe.name,
-                    "provider": {
-                        "type": "python",
-                        "module": probe.module,
-                        "func": probe.func,
-                        "arguments": probe.arguments
-                    },
-                    "tolerance": probe.tolerance
-                }
+        steady_state_hypothesis=SteadyState(
+            title=_STEADY_STATE_TITLE,
+            probes=[
+                Probe(
+                    type=probe.type,
+                    name=probe.name,
+                    provider=_provider(probe),
+                    tolerance=probe.tolerance
+                )
                 for probe in probes
             ]
-        },
-        "method": [
-            {
-                "type": action.type,
-                "name": action.name,
-                "provider": {
-                    "type": "python",
-                    "module": action.module,
-                    "func": action.func,
-                    "arguments": action.arguments
-                }
-            }
+        ),
+        method=[
+            MethodStep(type=action.type, name=action.name, provider=_provider(action))
             for action in actions
         ],
-        "rollbacks": [
-            {
-                "type": rollback.type,
-                "name": rollback.name,
-                "provider": {
-                    "type": "python",
-                    "module": rollback.module,
-                    "func": rollback.func,
-                    "arguments": rollback.arguments
-                }
-            }
+        rollbacks=[
+            MethodStep(type=rollback.type, name=rollback.name, provider=_provider(rollback))
             for rollback in rollbacks
         ]
-    }
-    
-    return experiment
+    )
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available chaos toolkit tools"""
-    return [
-        # AZ Failure Tools
-        Tool(
-            name="chaos_generate_az_failure_experiment",
-            description="Generate AZ failure experiment using azchaosaws.ec2.actions.fail_az",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "failure_type": {
-                        "type": "string", 
-                        "enum": ["network", "instance"],
-                        "default": "network",
-                        "description": "Type of failure to simulate"
-                    },
-                    "dry_run": {"type": "boolean", "default": False},
-                    "health_check_url": {"type": "string", "description": "URL for health checks"},
-                    "state_path": {"type": "string", "default": "./fail_az.ec2.json"},
-                    "output_file": {"type": "string", "default": "./az-failure-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "az"]
-            }
-        ),
-        Tool(
-            name="chaos_isolate_az_network",
-            description="Generate experiment to isolate AZ network connections",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "vpc_id": {"type": "string", "description": "VPC ID"},
-                    "dry_run": {"type": "boolean", "default": False},
-                    "output_file": {"type": "string", "default": "./isolate-az-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "az", "vpc_id"]
-            }
-        ),
-        Tool(
-            name="chaos_simulate_az_partition",
-            description="Generate experiment to simulate AZ network partition",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "partition_type": {"type": "string", "enum": ["partial", "complete"], "default": "partial"},
-                    "dry_run": {"type": "boolean", "default": False},
-                    "output_file": {"type": "string", "default": "./az-partition-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "az"]
-            }
-        ),
-        Tool(
-            name="chaos_generate_asg_az_failure_experiment",
-            description="Generate ASG AZ failure experiment using azchaosaws.asg.actions.fail_az",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "asg_tags": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "Key": {"type": "string"},
-                                "Value": {"type": "string"}
-                            }
-                        },
-                        "default": [{"Key": "AZ_FAILURE", "Value": "True"}]
-                    },
-                    "dry_run": {"type": "boolean", "default": False},
-                    "health_check_url": {"type": "string", "description": "URL for health checks"},
-                    "state_path": {"type": "string", "default": "./fail_az.asg.json"},
-                    "output_file": {"type": "string", "default": "./asg-az-failure-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
+def generate_experiment_json(
+    config: ExperimentConfig,
+    probes: List[ProbeConfig],
+    actions: List[ActionConfig],
+    rollbacks: List[ActionConfig]
+) -> Dict[str, Any]:
+    """Generate a complete Chaos Toolkit experiment JSON"""
+
+    return msgspec.to_builtins(_build_experiment(config, probes, actions, rollbacks))
+
+
+def _probe(name: str, module: str, func: str, arguments: Dict[str, Any]) -> Probe:
+    """Build a probe entry without an intermediate ProbeConfig"""
+    return Probe(
+        type=_TYPE_PROBE,
+        name=name,
+        provider=Provider(module=module, func=func, arguments=arguments)
+    )
+
+
+def _action(name: str, module: str, func: str, arguments: Dict[str, Any]) -> MethodStep:
+    """Build an action or rollback entry without an intermediate ActionConfig"""
+    return MethodStep(
+        type=_TYPE_ACTION,
+        name=name,
+        provider=Provider(module=module, func=func, arguments=arguments)
+    )
+
+
+# The health-check probe and recover_az rollback are identical scaffolds
+# on every call apart from one string field, so cache the built structs:
+# the trees are never mutated after construction, only encoded.
+@functools.lru_cache(maxsize=64)
+def _health_probe(url: str) -> Probe:
+    """Build (and cache) the standard HTTP health-check probe"""
+    return _probe(
+        "health_check",
+        "chaoslib.provider.http",
+        "get",
+        {"url": url, "expected_status": 200}
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _recover_action(name: str, module: str, state_path: str) -> MethodStep:
+    """Build (and cache) a recover_az rollback action"""
+    return _action(name, module, "recover_az", {"state_path": state_path})
+
+
+def _mk_provider(module: str, func: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a provider dict via key assignment on a fresh small dict
+
+    Assigning known keys one by one keeps the dict on CPython's
+    small-table fast path, unlike a BUILD_MAP of the full literal.
+    """
+    provider = {}
+    provider["type"] = _TYPE_PYTHON
+    provider["module"] = module
+    provider["func"] = func
+    provider["arguments"] = arguments
+    return provider
+
+
+def _experiment(
+    title: str,
+    description: str,
+    aws_region: str,
+    probes: List[Probe],
+    method: List[MethodStep],
+    rollbacks: List[MethodStep]
+) -> Experiment:
+    """Build an experiment tree from pre-built probe/action entries"""
+    return Experiment(
+        title=title,
+        description=description,
+        configuration={
+            "aws_region": aws_region
+        },
+        steady_state_hypothesis=SteadyState(title=_STEADY_STATE_TITLE, probes=probes),
+        method=method,
+        rollbacks=rollbacks
+    )
+
+
+# Tool definitions are static, so build them once at import time; each
+# list_tools RPC then returns the cached list instead of re-creating
+# ~24 Tool models and their inputSchema dicts.
+_TOOLS: List[Tool] = [
+    # AZ Failure Tools
+    Tool(
+        name="chaos_generate_az_failure_experiment",
+        description="Generate AZ failure experiment using azchaosaws.ec2.actions.fail_az",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "failure_type": {
+                    "type": "string", 
+                    "enum": ["network", "instance"],
+                    "default": "network",
+                    "description": "Type of failure to simulate"
                 },
-                "required": ["title", "az"]
-            }
-        ),
-        Tool(
-            name="chaos_generate_ec2_actions_experiment",
-            description="Generate EC2 chaos experiment using standard chaosaws actions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "action_type": {
-                        "type": "string",
-                        "enum": ["stop_instances", "terminate_instances", "reboot_instances"],
-                        "description": "Type of EC2 action"
-                    },
-                    "instance_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of instance IDs"
-                    },
-                    "filters": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "Name": {"type": "string"},
-                                "Values": {"type": "array", "items": {"type": "string"}}
-                            }
-                        },
-                        "description": "EC2 filters"
+                "dry_run": {"type": "boolean", "default": False},
+                "health_check_url": {"type": "string", "description": "URL for health checks"},
+                "state_path": {"type": "string", "default": "./fail_az.ec2.json"},
+                "output_file": {"type": "string", "default": "./az-failure-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "az"]
+        }
+    ),
+    Tool(
+        name="chaos_isolate_az_network",
+        description="Generate experiment to isolate AZ network connections",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "vpc_id": {"type": "string", "description": "VPC ID"},
+                "dry_run": {"type": "boolean", "default": False},
+                "output_file": {"type": "string", "default": "./isolate-az-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "az", "vpc_id"]
+        }
+    ),
+    Tool(
+        name="chaos_simulate_az_partition",
+        description="Generate experiment to simulate AZ network partition",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "partition_type": {"type": "string", "enum": ["partial", "complete"], "default": "partial"},
+                "dry_run": {"type": "boolean", "default": False},
+                "output_file": {"type": "string", "default": "./az-partition-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "az"]
+        }
+    ),
+    Tool(
+        name="chaos_generate_asg_az_failure_experiment",
+        description="Generate ASG AZ failure experiment using azchaosaws.asg.actions.fail_az",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "asg_tags": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "Key": {"type": "string"},
+                            "Value": {"type": "string"}
+                        }
                     },
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "output_file": {"type": "string", "default": "./ec2-chaos-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
+                    "default": [{"Key": "AZ_FAILURE", "Value": "True"}]
                 },
-                "required": ["title", "action_type"]
-            }
-        ),
-        Tool(
-            name="chaos_run_experiment",
-            description="Execute Chaos Toolkit experiment from JSON file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_file": {"type": "string", "description": "Path to experiment JSON file"},
-                    "dry_run": {"type": "boolean", "default": False},
-                    "journal_path": {"type": "string", "description": "Path to save journal"},
-                    "working_directory": {"type": "string", "description": "Working directory for execution"}
+                "dry_run": {"type": "boolean", "default": False},
+                "health_check_url": {"type": "string", "description": "URL for health checks"},
+                "state_path": {"type": "string", "default": "./fail_az.asg.json"},
+                "output_file": {"type": "string", "default": "./asg-az-failure-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "az"]
+        }
+    ),
+    Tool(
+        name="chaos_generate_ec2_actions_experiment",
+        description="Generate EC2 chaos experiment using standard chaosaws actions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "action_type": {
+                    "type": "string",
+                    "enum": ["stop_instances", "terminate_instances", "reboot_instances"],
+                    "description": "Type of EC2 action"
                 },
-                "required": ["experiment_file"]
-            }
-        ),
-        Tool(
-            name="chaos_validate_experiment",
-            description="Validate Chaos Toolkit experiment JSON syntax",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_file": {"type": "string", "description": "Path to experiment JSON file"}
+                "instance_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of instance IDs"
                 },
-                "required": ["experiment_file"]
-            }
-        ),
-        Tool(
-            name="chaos_rollback_from_state",
-            description="Execute rollback using state files",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "state_files": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of state file paths"
+                "filters": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "Name": {"type": "string"},
+                            "Values": {"type": "array", "items": {"type": "string"}}
+                        }
                     },
-                    "working_directory": {"type": "string", "description": "Working directory"}
-                },
-                "required": ["state_files"]
-            }
-        ),
-        # EC2 Chaos Tools
-        Tool(
-            name="chaos_stop_instances",
-            description="Generate experiment to stop EC2 instances",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "filters": {"type": "array", "items": {"type": "object"}, "description": "EC2 filters"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "force": {"type": "boolean", "default": False},
-                    "output_file": {"type": "string", "default": "./stop-instances-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title"]
-            }
-        ),
-        Tool(
-            name="chaos_terminate_instances",
-            description="Generate experiment to terminate EC2 instances",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "filters": {"type": "array", "items": {"type": "object"}, "description": "EC2 filters"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "output_file": {"type": "string", "default": "./terminate-instances-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
+                    "description": "EC2 filters"
                 },
-                "required": ["title"]
-            }
-        ),
-        Tool(
-            name="chaos_reboot_instances",
-            description="Generate experiment to reboot EC2 instances",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "filters": {"type": "array", "items": {"type": "object"}, "description": "EC2 filters"},
-                    "az": {"type": "string", "description": "Target availability zone"},
-                    "output_file": {"type": "string", "default": "./reboot-instances-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title"]
-            }
-        ),
-        Tool(
-            name="chaos_detach_volumes",
-            description="Generate experiment to detach EBS volumes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "volume_ids": {"type": "array", "items": {"type": "string"}, "description": "Volume IDs"},
-                    "device_names": {"type": "array", "items": {"type": "string"}, "description": "Device names"},
-                    "force": {"type": "boolean", "default": False},
-                    "output_file": {"type": "string", "default": "./detach-volumes-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title"]
-            }
-        ),
-        # ASG Chaos Tools
-        Tool(
-            name="chaos_suspend_asg_processes",
-            description="Generate experiment to suspend ASG processes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "asg_names": {"type": "array", "items": {"type": "string"}, "description": "ASG names"},
-                    "scaling_processes": {"type": "array", "items": {"type": "string"}, "description": "Processes to suspend"},
-                    "output_file": {"type": "string", "default": "./suspend-asg-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "asg_names"]
-            }
-        ),
-        Tool(
-            name="chaos_terminate_random_instances",
-            description="Generate experiment to terminate random ASG instances",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "asg_names": {"type": "array", "items": {"type": "string"}, "description": "ASG names"},
-                    "instance_count": {"type": "integer", "description": "Number of instances to terminate"},
-                    "az_name": {"type": "string", "description": "Target availability zone"},
-                    "output_file": {"type": "string", "default": "./terminate-random-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "asg_names"]
-            }
-        ),
-        # SSM Chaos Tools
-        Tool(
-            name="chaos_ssm_send_command",
-            description="Generate experiment to send SSM commands",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "document_name": {"type": "string", "default": "AWS-RunShellScript"},
-                    "commands": {"type": "array", "items": {"type": "string"}, "description": "Commands to execute"},
-                    "output_file": {"type": "string", "default": "./ssm-command-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "instance_ids", "commands"]
-            }
-        ),
-        Tool(
-            name="chaos_ssm_stress_cpu",
-            description="Generate experiment for CPU stress via SSM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "cpu_cores": {"type": "integer", "default": 2},
-                    "duration_seconds": {"type": "integer", "default": 300},
-                    "output_file": {"type": "string", "default": "./ssm-cpu-stress-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "instance_ids"]
-            }
-        ),
-        Tool(
-            name="chaos_ssm_fill_disk",
-            description="Generate experiment to fill disk via SSM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "path": {"type": "string", "default": "/tmp"},
-                    "size_mb": {"type": "integer", "default": 1024},
-                    "duration_seconds": {"type": "integer", "default": 600},
-                    "output_file": {"type": "string", "default": "./ssm-fill-disk-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "instance_ids"]
-            }
-        ),
-        Tool(
-            name="chaos_ssm_kill_process",
-            description="Generate experiment to kill process via SSM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "process_name": {"type": "string", "description": "Process name to kill"},
-                    "signal": {"type": "string", "default": "SIGKILL"},
-                    "output_file": {"type": "string", "default": "./ssm-kill-process-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "instance_ids", "process_name"]
-            }
-        ),
-        # Network Chaos Tools
-        Tool(
-            name="chaos_modify_security_groups",
-            description="Generate experiment to modify security group rules",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "group_ids": {"type": "array", "items": {"type": "string"}, "description": "Security group IDs"},
-                    "action": {"type": "string", "enum": ["revoke", "authorize"], "description": "Action to perform"},
-                    "rules": {"type": "array", "items": {"type": "object"}, "description": "Security group rules"},
-                    "output_file": {"type": "string", "default": "./modify-sg-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "group_ids", "action"]
-            }
-        ),
-        Tool(
-            name="chaos_simulate_network_latency",
-            description="Generate experiment to simulate network latency",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
-                    "latency_ms": {"type": "integer", "default": 100},
-                    "duration_seconds": {"type": "integer", "default": 300},
-                    "output_file": {"type": "string", "default": "./network-latency-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "instance_ids"]
-            }
-        ),
-        # RDS Chaos Tools
-        Tool(
-            name="chaos_reboot_db_instance",
-            description="Generate experiment to reboot RDS instance",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "db_instance_identifier": {"type": "string", "description": "RDS instance identifier"},
-                    "force_failover": {"type": "boolean", "default": False},
-                    "output_file": {"type": "string", "default": "./reboot-db-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "db_instance_identifier"]
-            }
-        ),
-        Tool(
-            name="chaos_failover_db_cluster",
-            description="Generate experiment to failover RDS cluster",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "db_cluster_identifier": {"type": "string", "description": "RDS cluster identifier"},
-                    "target_db_instance_identifier": {"type": "string", "description": "Target instance for failover"},
-                    "output_file": {"type": "string", "default": "./failover-cluster-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
-                },
-                "required": ["title", "db_cluster_identifier"]
-            }
-        ),
-        # Load Balancer Chaos Tools
-        Tool(
-            name="chaos_deregister_targets",
-            description="Generate experiment to deregister ALB/NLB targets",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Experiment title"},
-                    "target_group_arn": {"type": "string", "description": "Target group ARN"},
-                    "target_ids": {"type": "array", "items": {"type": "string"}, "description": "Target IDs"},
-                    "output_file": {"type": "string", "default": "./deregister-targets-experiment.json"},
-                    "aws_region": {"type": "string", "default": "us-east-1"}
+                "az": {"type": "string", "description": "Target availability zone"},
+                "output_file": {"type": "string", "default": "./ec2-chaos-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "action_type"]
+        }
+    ),
+    Tool(
+        name="chaos_run_experiment",
+        description="Execute Chaos Toolkit experiment from JSON file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_file": {"type": "string", "description": "Path to experiment JSON file"},
+                "dry_run": {"type": "boolean", "default": False},
+                "journal_path": {"type": "string", "description": "Path to save journal"},
+                "working_directory": {"type": "string", "description": "Working directory for execution"}
+            },
+            "required": ["experiment_file"]
+        }
+    ),
+    Tool(
+        name="chaos_validate_experiment",
+        description="Validate Chaos Toolkit experiment JSON syntax",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_file": {"type": "string", "description": "Path to experiment JSON file"}
+            },
+            "required": ["experiment_file"]
+        }
+    ),
+    Tool(
+        name="chaos_rollback_from_state",
+        description="Execute rollback using state files",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "state_files": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of state file paths"
                 },
-                "required": ["title", "target_group_arn"]
-            }
-        )
-    ]
-
-
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Handle tool calls"""
-    
-    # AZ Failure Tools
-    if name == "chaos_generate_az_failure_experiment":
-        return await generate_az_failure_experiment(arguments)
-    elif name == "chaos_generate_asg_az_failure_experiment":
-        return await generate_asg_az_failure_experiment(arguments)
-    elif name == "chaos_isolate_az_network":
-        return await generate_generic_experiment(arguments, "azchaosaws.ec2.actions", "isolate_az_network")
-    elif name == "chaos_simulate_az_partition":
-        return await generate_generic_experiment(arguments, "azchaosaws.ec2.actions", "simulate_az_partition")
-    
+                "working_directory": {"type": "string", "description": "Working directory"}
+            },
+            "required": ["state_files"]
+        }
+    ),
     # EC2 Chaos Tools
-    elif name == "chaos_stop_instances":
-        return await generate_generic_experiment(arguments, "chaosaws.ec2.actions", "stop_instances")
-    elif name == "chaos_terminate_instances":
-        return await generate_generic_experiment(arguments, "chaosaws.ec2.actions", "terminate_instances")
-    elif name == "chaos_reboot_instances":
-        return await generate_generic_experiment(arguments, "chaosaws.ec2.actions", "reboot_instances")
-    elif name == "chaos_detach_volumes":
-        return await generate_generic_experiment(arguments, "chaosaws.ec2.actions", "detach_volumes")
-    
+    Tool(
+        name="chaos_stop_instances",
+        description="Generate experiment to stop EC2 instances",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "filters": {"type": "array", "items": {"type": "object"}, "description": "EC2 filters"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "force": {"type": "boolean", "default": False},
+                "output_file": {"type": "string", "default": "./stop-instances-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="chaos_terminate_instances",
+        description="Generate experiment to terminate EC2 instances",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "filters": {"type": "array", "items": {"type": "object"}, "description": "EC2 filters"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "output_file": {"type": "string", "default": "./terminate-instances-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="chaos_reboot_instances",
+        description="Generate experiment to reboot EC2 instances",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "filters": {"type": "array", "items": {"type": "object"}, "description": "EC2 filters"},
+                "az": {"type": "string", "description": "Target availability zone"},
+                "output_file": {"type": "string", "default": "./reboot-instances-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="chaos_detach_volumes",
+        description="Generate experiment to detach EBS volumes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "volume_ids": {"type": "array", "items": {"type": "string"}, "description": "Volume IDs"},
+                "device_names": {"type": "array", "items": {"type": "string"}, "description": "Device names"},
+                "force": {"type": "boolean", "default": False},
+                "output_file": {"type": "string", "default": "./detach-volumes-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title"]
+        }
+    ),
     # ASG Chaos Tools
-    elif name == "chaos_suspend_asg_processes":
-        return await generate_generic_experiment(arguments, "chaosaws.asg.actions", "suspend_processes")
-    elif name == "chaos_terminate_random_instances":
-        return await generate_generic_experiment(arguments, "chaosaws.asg.actions", "terminate_random_instances")
-    
+    Tool(
+        name="chaos_suspend_asg_processes",
+        description="Generate experiment to suspend ASG processes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "asg_names": {"type": "array", "items": {"type": "string"}, "description": "ASG names"},
+                "scaling_processes": {"type": "array", "items": {"type": "string"}, "description": "Processes to suspend"},
+                "output_file": {"type": "string", "default": "./suspend-asg-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "asg_names"]
+        }
+    ),
+    Tool(
+        name="chaos_terminate_random_instances",
+        description="Generate experiment to terminate random ASG instances",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "asg_names": {"type": "array", "items": {"type": "string"}, "description": "ASG names"},
+                "instance_count": {"type": "integer", "description": "Number of instances to terminate"},
+                "az_name": {"type": "string", "description": "Target availability zone"},
+                "output_file": {"type": "string", "default": "./terminate-random-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "asg_names"]
+        }
+    ),
     # SSM Chaos Tools
-    elif name == "chaos_ssm_send_command":
-        return await generate_generic_experiment(arguments, "chaosaws.ssm.actions", "send_command")
-    elif name == "chaos_ssm_stress_cpu":
-        return await generate_ssm_stress_experiment(arguments, "cpu")
-    elif name == "chaos_ssm_fill_disk":
-        return await generate_ssm_stress_experiment(arguments, "disk")
-    elif name == "chaos_ssm_kill_process":
-        return await generate_generic_experiment(arguments, "chaosaws.ssm.actions", "kill_process")
-    
+    Tool(
+        name="chaos_ssm_send_command",
+        description="Generate experiment to send SSM commands",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "document_name": {"type": "string", "default": "AWS-RunShellScript"},
+                "commands": {"type": "array", "items": {"type": "string"}, "description": "Commands to execute"},
+                "output_file": {"type": "string", "default": "./ssm-command-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "instance_ids", "commands"]
+        }
+    ),
+    Tool(
+        name="chaos_ssm_stress_cpu",
+        description="Generate experiment for CPU stress via SSM",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "cpu_cores": {"type": "integer", "default": 2},
+                "duration_seconds": {"type": "integer", "default": 300},
+                "output_file": {"type": "string", "default": "./ssm-cpu-stress-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "instance_ids"]
+        }
+    ),
+    Tool(
+        name="chaos_ssm_fill_disk",
+        description="Generate experiment to fill disk via SSM",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "path": {"type": "string", "default": "/tmp"},
+                "size_mb": {"type": "integer", "default": 1024},
+                "duration_seconds": {"type": "integer", "default": 600},
+                "output_file": {"type": "string", "default": "./ssm-fill-disk-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "instance_ids"]
+        }
+    ),
+    Tool(
+        name="chaos_ssm_kill_process",
+        description="Generate experiment to kill process via SSM",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "process_name": {"type": "string", "description": "Process name to kill"},
+                "signal": {"type": "string", "default": "SIGKILL"},
+                "output_file": {"type": "string", "default": "./ssm-kill-process-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "instance_ids", "process_name"]
+        }
+    ),
     # Network Chaos Tools
-    elif name == "chaos_modify_security_groups":
-        return await generate_generic_experiment(arguments, "chaosaws.ec2.actions", "modify_security_groups")
-    elif name == "chaos_simulate_network_latency":
-        return await generate_generic_experiment(arguments, "chaosaws.ec2.actions", "simulate_network_latency")
-    
+    Tool(
+        name="chaos_modify_security_groups",
+        description="Generate experiment to modify security group rules",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "group_ids": {"type": "array", "items": {"type": "string"}, "description": "Security group IDs"},
+                "action": {"type": "string", "enum": ["revoke", "authorize"], "description": "Action to perform"},
+                "rules": {"type": "array", "items": {"type": "object"}, "description": "Security group rules"},
+                "output_file": {"type": "string", "default": "./modify-sg-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "group_ids", "action"]
+        }
+    ),
+    Tool(
+        name="chaos_simulate_network_latency",
+        description="Generate experiment to simulate network latency",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "instance_ids": {"type": "array", "items": {"type": "string"}, "description": "Instance IDs"},
+                "latency_ms": {"type": "integer", "default": 100},
+                "duration_seconds": {"type": "integer", "default": 300},
+                "output_file": {"type": "string", "default": "./network-latency-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "instance_ids"]
+        }
+    ),
     # RDS Chaos Tools
-    elif name == "chaos_reboot_db_instance":
-        return await generate_generic_experiment(arguments, "chaosaws.rds.actions", "reboot_db_instance")
-    elif name == "chaos_failover_db_cluster":
-        return await generate_generic_experiment(arguments, "chaosaws.rds.actions", "failover_db_cluster")
-    
+    Tool(
+        name="chaos_reboot_db_instance",
+        description="Generate experiment to reboot RDS instance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "db_instance_identifier": {"type": "string", "description": "RDS instance identifier"},
+                "force_failover": {"type": "boolean", "default": False},
+                "output_file": {"type": "string", "default": "./reboot-db-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "db_instance_identifier"]
+        }
+    ),
+    Tool(
+        name="chaos_failover_db_cluster",
+        description="Generate experiment to failover RDS cluster",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "db_cluster_identifier": {"type": "string", "description": "RDS cluster identifier"},
+                "target_db_instance_identifier": {"type": "string", "description": "Target instance for failover"},
+                "output_file": {"type": "string", "default": "./failover-cluster-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "db_cluster_identifier"]
+        }
+    ),
     # Load Balancer Chaos Tools
-    elif name == "chaos_deregister_targets":
-        return await generate_generic_experiment(arguments, "chaosaws.elbv2.actions", "deregister_targets")
-    
-    # Original Tools
-    elif name == "chaos_generate_ec2_actions_experiment":
-        return await generate_ec2_actions_experiment(arguments)
-    elif name == "chaos_run_experiment":
-        return await run_experiment(arguments)
-    elif name == "chaos_validate_experiment":
-        return await validate_experiment(arguments)
-    elif name == "chaos_rollback_from_state":
-        return await rollback_from_state(arguments)
-    else:
+    Tool(
+        name="chaos_deregister_targets",
+        description="Generate experiment to deregister ALB/NLB targets",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Experiment title"},
+                "target_group_arn": {"type": "string", "description": "Target group ARN"},
+                "target_ids": {"type": "array", "items": {"type": "string"}, "description": "Target IDs"},
+                "output_file": {"type": "string", "default": "./deregister-targets-experiment.json"},
+                "include_preview": {"type": "boolean", "default": False, "description": "Include the experiment JSON in the response"},
+                "aws_region": {"type": "string", "default": "us-east-1"}
+            },
+            "required": ["title", "target_group_arn"]
+        }
+    ),
+    # Batch Tool
+    Tool(
+        name="chaos_generate_batch",
+        description="Generate multiple experiments in a single call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobs": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {"type": "string", "description": "Generation tool name"},
+                            "args": {"type": "object", "description": "Arguments for the tool"}
+                        },
+                        "required": ["tool", "args"]
+                    },
+                    "description": "List of generation jobs"
+                }
+            },
+            "required": ["jobs"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available chaos toolkit tools"""
+    return _TOOLS
+
+
+# Precompiled argument validators: fastjsonschema generates straight-line
+# Python per schema at import time, so per-call validation skips the
+# schema-tree walk entirely. use_default=False keeps validation a pure
+# check — the handlers apply their own defaults, so the experiment
+# content must not depend on whether the speed extra is installed.
+if fastjsonschema is not None:
+    _VALIDATORS = {
+        tool.name: fastjsonschema.compile(tool.inputSchema, use_default=False)
+        for tool in _TOOLS
+    }
+else:
+    _VALIDATORS = {}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Handle tool calls"""
+
+    name = sys.intern(name)
+    handler, extra = _DISPATCH.get(name) or (None, None)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
 
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        try:
+            validator(arguments)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValueError(f"Invalid arguments for {name}: {e.message}") from e
 
-async def generate_az_failure_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Generate AZ failure experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"AZ failure test for {args['az']}",
-        aws_region=args.get("aws_region", "us-east-1")
+    if extra:
+        return await handler(arguments, *extra)
+    return await handler(arguments)
+
+
+# Output directories already created this process; repeat writes to the
+# same location skip the makedirs stat entirely.
+_ENSURED_DIRS: set = set()
+
+
+def _write_payload(output_file: str, payload: bytes) -> None:
+    """Ensure the output directory exists, then write the payload
+
+    Experiment files are small (typically <10 KB), so the pre-encoded
+    buffer goes out in a single unbuffered write() syscall rather than
+    through a Python file object.
+    """
+    directory = os.path.dirname(output_file) or "."
+    if directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+# Encoded payloads memoized on the content-affecting arguments. The
+# generators are pure in everything but the disk write, so a repeat
+# call with identical inputs (modulo output_file) reuses the cached
+# bytes and only pays for the write.
+_PAYLOAD_CACHE: Dict[Tuple[str, str], bytes] = {}
+_PAYLOAD_CACHE_MAX = 256
+
+# Previews larger than this are split across multiple response items.
+_PREVIEW_CHUNK_SIZE = 64 * 1024
+
+
+def _payload_cache_key(
+    kind: str, args: Dict[str, Any]
+) -> Optional[Tuple[str, str]]:
+    """Build a hashable cache key from the content-affecting arguments"""
+    content = {
+        k: v for k, v in args.items()
+        if k not in ("output_file", "include_preview", "_debug")
+    }
+    try:
+        return (kind, json.dumps(content, sort_keys=True))
+    except TypeError:  # non-JSON argument value: skip memoization
+        return None
+
+
+async def _write_and_respond(
+    experiment: Dict[str, Any],
+    output_file: str,
+    label: str,
+    cache_key: Optional[Tuple[str, str]] = None,
+    include_preview: bool = False,
+    debug: bool = False,
+) -> List[Dict[str, Any]]:
+    """Write an experiment to disk and build the MCP text response
+
+    The file is written compact. The pretty-printed preview doubles the
+    response payload, so it is only built when the caller passes
+    include_preview (the generators map this to an ``include_preview``
+    tool argument); it is then re-indented from the already-encoded
+    bytes so the experiment is still serialized only once.
+    """
+    payload = _PAYLOAD_CACHE.get(cache_key) if cache_key is not None else None
+    if payload is None:
+        payload = _encode_experiment(experiment)
+        if cache_key is not None:
+            if len(_PAYLOAD_CACHE) >= _PAYLOAD_CACHE_MAX:
+                _PAYLOAD_CACHE.pop(next(iter(_PAYLOAD_CACHE)))
+            _PAYLOAD_CACHE[cache_key] = payload
+    await asyncio.to_thread(_write_payload, output_file, payload)
+
+    head: Dict[str, Any] = {"type": "text"}
+    if debug:
+        # Debug callers (tests, tooling) get the built document back
+        # in-memory, sparing them a reparse of the file they just wrote.
+        head["_experiment"] = (
+            msgspec.to_builtins(experiment)
+            if isinstance(experiment, Experiment)
+            else experiment
+        )
+
+    if not include_preview:
+        head["text"] = f"Generated {label}: {output_file}"
+        return [head]
+
+    preview = msgspec.json.format(payload, indent=2).decode()
+    if len(preview) <= _PREVIEW_CHUNK_SIZE:
+        head["text"] = (
+            f"Generated {label}: {output_file}\n\nExperiment preview:\n{preview}"
+        )
+        return [head]
+
+    # Large previews go out as a header item plus fixed-size slices, so
+    # the transport can stream them instead of carrying one huge string.
+    head["text"] = f"Generated {label}: {output_file}\n\nExperiment preview:"
+    items = [head]
+    items.extend(
+        {"type": "text", "text": preview[start:start + _PREVIEW_CHUNK_SIZE]}
+        for start in range(0, len(preview), _PREVIEW_CHUNK_SIZE)
     )
-    
+    return items
+
+
+# AZ failure experiment shapes: the EC2 and ASG variants differ only in
+# fixed strings and the action argument layout, so both are described
+# here and built by one shared handler.
+_AZ_FAILURE_SPECS = {
+    "ec2": {
+        "label": "AZ failure experiment",
+        "description": lambda p: f"AZ failure test for {p['az']}",
+        "module": "azchaosaws.ec2.actions",
+        "action_name": "fail_az",
+        "rollback_name": "recover_az",
+        "defaults": {
+            "dry_run": False,
+            "failure_type": "network",
+            "state_path": "./fail_az.ec2.json",
+            "output_file": "./az-failure-experiment.json",
+            "aws_region": "us-east-1",
+        },
+        "action_args": lambda p: {
+            "az": p["az"],
+            "dry_run": p["dry_run"],
+            "failure_type": p["failure_type"],
+            "state_path": p["state_path"]
+        },
+    },
+    "asg": {
+        "label": "ASG AZ failure experiment",
+        "description": lambda p: f"ASG AZ failure test for {p['az']}",
+        "module": "azchaosaws.asg.actions",
+        "action_name": "fail_asg_az",
+        "rollback_name": "recover_asg_az",
+        "defaults": {
+            "dry_run": False,
+            "asg_tags": [{"Key": "AZ_FAILURE", "Value": "True"}],
+            "state_path": "./fail_az.asg.json",
+            "output_file": "./asg-az-failure-experiment.json",
+            "aws_region": "us-east-1",
+        },
+        "action_args": lambda p: {
+            "az": p["az"],
+            "dry_run": p["dry_run"],
+            "tags": p["asg_tags"],
+            "state_path": p["state_path"]
+        },
+    },
+}
+
+
+async def _generate_az_failure(
+    args: Dict[str, Any], spec: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Generate an AZ failure experiment from a registry entry"""
+
+    # One merge resolves every default; the handler then reads plain
+    # keys instead of repeating args.get(key, default) per field.
+    p = {**spec["defaults"], **args}
+    state_path = p["state_path"]
+    output_file = p["output_file"]
+
     # Health check probe
     probes = []
-    if args.get("health_check_url"):
-        probes.append(ProbeConfig(
-            name="health_check",
-            module="chaoslib.provider.http",
-            func="get",
-            arguments={
-                "url": args["health_check_url"],
-                "expected_status": 200
-            }
-        ))
-    
-    # AZ failure action
-    actions = [ActionConfig(
-        name="fail_az",
-        module="azchaosaws.ec2.actions",
-        func="fail_az",
-        arguments={
-            "az": args["az"],
-            "dry_run": args.get("dry_run", False),
-            "failure_type": args.get("failure_type", "network"),
-            "state_path": args.get("state_path", "./fail_az.ec2.json")
-        }
-    )]
-    
-    # Rollback action
-    rollbacks = [ActionConfig(
-        name="recover_az",
-        module="azchaosaws.ec2.actions",
-        func="recover_az",
-        arguments={
-            "state_path": args.get("state_path", "./fail_az.ec2.json")
-        }
-    )]
-    
-    experiment = generate_experiment_json(config, probes, actions, rollbacks)
-    
-    # Write to file
-    output_file = args.get("output_file", "./az-failure-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated AZ failure experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+    if p.get("health_check_url"):
+        probes.append(_health_probe(p["health_check_url"]))
+
+    experiment = _experiment(
+        title=p["title"],
+        description=spec["description"](p),
+        aws_region=p["aws_region"],
+        probes=probes,
+        # AZ failure action
+        method=[_action(
+            spec["action_name"],
+            spec["module"],
+            "fail_az",
+            spec["action_args"](p)
+        )],
+        # Rollback action
+        rollbacks=[_recover_action(spec["rollback_name"], spec["module"], state_path)]
+    )
+
+    return await _write_and_respond(
+        experiment, output_file, spec["label"],
+        cache_key=_payload_cache_key(spec["label"], args),
+        include_preview=bool(args.get("include_preview")),
+        debug=bool(args.get("_debug")),
+    )
+
+
+async def generate_az_failure_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Generate AZ failure experiment"""
+    return await _generate_az_failure(args, _AZ_FAILURE_SPECS["ec2"])
 
 
 async def generate_asg_az_failure_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate ASG AZ failure experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"ASG AZ failure test for {args['az']}",
-        aws_region=args.get("aws_region", "us-east-1")
-    )
-    
-    # Health check probe
-    probes = []
-    if args.get("health_check_url"):
-        probes.append(ProbeConfig(
-            name="health_check",
-            module="chaoslib.provider.http",
-            func="get",
-            arguments={
-                "url": args["health_check_url"],
-                "expected_status": 200
-            }
-        ))
-    
-    # ASG AZ failure action
-    actions = [ActionConfig(
-        name="fail_asg_az",
-        module="azchaosaws.asg.actions",
-        func="fail_az",
-        arguments={
-            "az": args["az"],
-            "dry_run": args.get("dry_run", False),
-            "tags": args.get("asg_tags", [{"Key": "AZ_FAILURE", "Value": "True"}]),
-            "state_path": args.get("state_path", "./fail_az.asg.json")
-        }
-    )]
-    
-    # Rollback action
-    rollbacks = [ActionConfig(
-        name="recover_asg_az",
-        module="azchaosaws.asg.actions",
-        func="recover_az",
-        arguments={
-            "state_path": args.get("state_path", "./fail_az.asg.json")
-        }
-    )]
-    
-    experiment = generate_experiment_json(config, probes, actions, rollbacks)
-    
-    # Write to file
-    output_file = args.get("output_file", "./asg-az-failure-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated ASG AZ failure experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+    return await _generate_az_failure(args, _AZ_FAILURE_SPECS["asg"])
+
+
+_DEFAULTS_EC2 = {
+    "output_file": "./ec2-chaos-experiment.json",
+    "aws_region": "us-east-1",
+}
 
 
 async def generate_ec2_actions_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate EC2 actions experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"EC2 {args['action_type']} experiment",
-        aws_region=args.get("aws_region", "us-east-1")
-    )
-    
+
+    p = {**_DEFAULTS_EC2, **args}
+    action_type = p["action_type"]
+    output_file = p["output_file"]
+
     # Build action arguments
     action_args = {}
-    if args.get("instance_ids"):
-        action_args["instance_ids"] = args["instance_ids"]
-    if args.get("filters"):
-        action_args["filters"] = args["filters"]
-    if args.get("az"):
-        action_args["az"] = args["az"]
-    
-    # EC2 action
-    actions = [ActionConfig(
-        name=args["action_type"],
-        module="chaosaws.ec2.actions",
-        func=args["action_type"],
-        arguments=action_args
-    )]
-    
-    experiment = generate_experiment_json(config, [], actions, [])
-    
-    # Write to file
-    output_file = args.get("output_file", "./ec2-chaos-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated EC2 {args['action_type']} experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+    if p.get("instance_ids"):
+        action_args["instance_ids"] = p["instance_ids"]
+    if p.get("filters"):
+        action_args["filters"] = p["filters"]
+    if p.get("az"):
+        action_args["az"] = p["az"]
 
+    experiment = _experiment(
+        title=p["title"],
+        description=f"EC2 {action_type} experiment",
+        aws_region=p["aws_region"],
+        probes=[],
+        method=[_action(action_type, "chaosaws.ec2.actions", action_type, action_args)],
+        rollbacks=[]
+    )
+
+    return await _write_and_respond(
+        experiment, output_file, f"EC2 {action_type} experiment",
+        cache_key=_payload_cache_key("ec2_actions", args),
+        include_preview=bool(args.get("include_preview")),
+        debug=bool(args.get("_debug")),
+    )
+
+
+async def generate_generic_experiment(args: Dict[str, Any], module: str, func: str) -> List[Dict[str, Any]]:
     """Generate a generic chaos experiment"""
-    
-    config = ExperimentConfig(
+
+    output_file = args.get("output_file", f"./{func}-experiment.json")
+
+    # Build action arguments by excluding meta fields
+    action_args = {k: v for k, v in args.items()
+                   if k not in ["title", "output_file", "aws_region",
+                                "include_preview", "_debug"]}
+
+    experiment = _experiment(
         title=args["title"],
         description=f"{func} experiment",
-        aws_region=args.get("aws_region", "us-east-1")
+        aws_region=args.get("aws_region", "us-east-1"),
+        probes=[],
+        method=[_action(func, module, func, action_args)],
+        rollbacks=[]
     )
-    
-    # Build action arguments by excluding meta fields
-    action_args = {k: v for k, v in args.items() 
-                   if k not in ["title", "output_file", "aws_region"]}
-    
-    # Create action
-    actions = [ActionConfig(
-        name=func,
-        module=module,
-        func=func,
-        arguments=action_args
-    )]
-    
-    experiment = generate_experiment_json(config, [], actions, [])
-    
-    # Write to file
-    output_file = args.get("output_file", f"./{func}-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated {func} experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+
+    return await _write_and_respond(
+        experiment, output_file, f"{func} experiment",
+        cache_key=_payload_cache_key(f"{module}.{func}", args),
+        include_preview=bool(args.get("include_preview")),
+        debug=bool(args.get("_debug")),
+    )
+
+
+# SSM stress shell command templates, hoisted to constants so each call
+# only pays for str.format substitution of the variable fields.
+_SSM_CPU_CMD = "stress --cpu {cores} --timeout {duration}s"
+_SSM_DD_CMD = "dd if=/dev/zero of={path}/chaos_fill bs=1M count={size_mb}"
+_SSM_SLEEP_CMD = "sleep {duration}"
+_SSM_RM_CMD = "rm -f {path}/chaos_fill"
+
+
+_DEFAULTS_SSM = {
+    "cpu": {"cpu_cores": 2, "duration_seconds": 300, "aws_region": "us-east-1"},
+    "disk": {
+        "size_mb": 1024,
+        "duration_seconds": 600,
+        "path": "/tmp",
+        "aws_region": "us-east-1",
+    },
+}
 
 
 async def generate_ssm_stress_experiment(args: Dict[str, Any], stress_type: str) -> List[Dict[str, Any]]:
     """Generate SSM stress experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"SSM {stress_type} stress experiment",
-        aws_region=args.get("aws_region", "us-east-1")
-    )
-    
+
+    p = {**_DEFAULTS_SSM.get(stress_type, {"aws_region": "us-east-1"}), **args}
+    output_file = p.get("output_file", f"./ssm-{stress_type}-stress-experiment.json")
+
     # Build stress command based on type
     if stress_type == "cpu":
-        commands = [f"stress --cpu {args.get('cpu_cores', 2)} --timeout {args.get('duration_seconds', 300)}s"]
+        commands = [_SSM_CPU_CMD.format(
+            cores=p['cpu_cores'],
+            duration=p['duration_seconds']
+        )]
     elif stress_type == "disk":
-        size_mb = args.get('size_mb', 1024)
-        duration = args.get('duration_seconds', 600)
-        path = args.get('path', '/tmp')
         commands = [
-            f"dd if=/dev/zero of={path}/chaos_fill bs=1M count={size_mb}",
-            f"sleep {duration}",
-            f"rm -f {path}/chaos_fill"
+            _SSM_DD_CMD.format(path=p['path'], size_mb=p['size_mb']),
+            _SSM_SLEEP_CMD.format(duration=p['duration_seconds']),
+            _SSM_RM_CMD.format(path=p['path'])
         ]
     else:
         commands = ["echo 'Unknown stress type'"]
-    
-    # Create SSM action
-    actions = [ActionConfig(
-        name=f"ssm_{stress_type}_stress",
-        module="chaosaws.ssm.actions",
-        func="send_command",
-        arguments={
-            "instance_ids": args["instance_ids"],
-            "document_name": "AWS-RunShellScript",
-            "parameters": {
-                "commands": commands
-            }
-        }
-    )]
-    
-    experiment = generate_experiment_json(config, [], actions, [])
-    
-    # Write to file
-    output_file = args.get("output_file", f"./ssm-{stress_type}-stress-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated SSM {stress_type} stress experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
 
+    experiment = _experiment(
+        title=p["title"],
+        description=f"SSM {stress_type} stress experiment",
+        aws_region=p["aws_region"],
+        probes=[],
+        # SSM action
+        method=[_action(
+            f"ssm_{stress_type}_stress",
+            "chaosaws.ssm.actions",
+            "send_command",
+            {
+                "instance_ids": p["instance_ids"],
+                "document_name": "AWS-RunShellScript",
+                "parameters": {
+                    "commands": commands
+                }
+            }
+        )],
+        rollbacks=[]
+    )
 
-    """Generate AZ failure experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"AZ failure test for {args['az']}",
-        aws_region=args.get("aws_region", "us-east-1")
+    return await _write_and_respond(
+        experiment, output_file, f"SSM {stress_type} stress experiment",
+        cache_key=_payload_cache_key(f"ssm_{stress_type}_stress", args),
+        include_preview=bool(args.get("include_preview")),
+        debug=bool(args.get("_debug")),
     )
-    
-    # Health check probe
-    probes = []
-    if args.get("health_check_url"):
-        probes.append(ProbeConfig(
-            name="health_check",
-            module="chaoslib.provider.http",
-            func="get",
-            arguments={
-                "url": args["health_check_url"],
-                "expected_status": 200
-            }
-        ))
-    
-    # AZ failure action
-    actions = [ActionConfig(
-        name="fail_az",
-        module="azchaosaws.ec2.actions",
-        func="fail_az",
-        arguments={
-            "az": args["az"],
-            "dry_run": args.get("dry_run", False),
-            "failure_type": args.get("failure_type", "network"),
-            "state_path": args.get("state_path", "./fail_az.ec2.json")
-        }
-    )]
-    
-    # Rollback action
-    rollbacks = [ActionConfig(
-        name="recover_az",
-        module="azchaosaws.ec2.actions",
-        func="recover_az",
-        arguments={
-            "state_path": args.get("state_path", "./fail_az.ec2.json")
-        }
-    )]
-    
-    experiment = generate_experiment_json(config, probes, actions, rollbacks)
-    
-    # Write to file
-    output_file = args.get("output_file", "./az-failure-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated AZ failure experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
 
 
-async def generate_asg_az_failure_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Generate ASG AZ failure experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"ASG AZ failure test for {args['az']}",
-        aws_region=args.get("aws_region", "us-east-1")
-    )
-    
-    # Health check probe
-    probes = []
-    if args.get("health_check_url"):
-        probes.append(ProbeConfig(
-            name="health_check",
-            module="chaoslib.provider.http",
-            func="get",
-            arguments={
-                "url": args["health_check_url"],
-                "expected_status": 200
-            }
-        ))
-    
-    # ASG AZ failure action
-    actions = [ActionConfig(
-        name="fail_asg_az",
-        module="azchaosaws.asg.actions",
-        func="fail_az",
-        arguments={
-            "az": args["az"],
-            "dry_run": args.get("dry_run", False),
-            "tags": args.get("asg_tags", [{"Key": "AZ_FAILURE", "Value": "True"}]),
-            "state_path": args.get("state_path", "./fail_az.asg.json")
-        }
-    )]
-    
-    # Rollback action
-    rollbacks = [ActionConfig(
-        name="recover_asg_az",
-        module="azchaosaws.asg.actions",
-        func="recover_az",
-        arguments={
-            "state_path": args.get("state_path", "./fail_az.asg.json")
-        }
-    )]
-    
-    experiment = generate_experiment_json(config, probes, actions, rollbacks)
-    
-    # Write to file
-    output_file = args.get("output_file", "./asg-az-failure-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated ASG AZ failure experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+async def generate_batch(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Generate several experiments in one call
 
+    Amortizes the per-call JSON-RPC, validation and dispatch overhead
+    across N experiments and runs their disk writes concurrently.
+    """
 
-async def generate_ec2_actions_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Generate EC2 actions experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"EC2 {args['action_type']} experiment",
-        aws_region=args.get("aws_region", "us-east-1")
+    async def run_job(job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        tool = job["tool"]
+        if tool not in _GENERATION_TOOLS:
+            raise ValueError(f"Unknown generation tool: {tool}")
+        validator = _VALIDATORS.get(tool)
+        if validator is not None:
+            try:
+                validator(job["args"])
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Invalid arguments for {tool}: {e.message}") from e
+        handler, extra = _DISPATCH[tool]
+        if extra:
+            return await handler(job["args"], *extra)
+        return await handler(job["args"])
+
+    results = await asyncio.gather(*(run_job(job) for job in args["jobs"]))
+
+    # First line of each response is the "Generated <label>: <file>" summary
+    lines = [f"Generated {len(results)} experiments:"]
+    lines.extend(result[0]["text"].split("\n", 1)[0] for result in results)
+
+    return [{"type": "text", "text": "\n".join(lines)}]
+
+
+async def _run_chaos(
+    cmd: List[str],
+    cwd: Optional[str] = None,
+    timeout: Optional[float] = None
+) -> tuple:
+    """Run a chaos CLI command without blocking the event loop"""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
-    
-    # Build action arguments
-    action_args = {}
-    if args.get("instance_ids"):
-        action_args["instance_ids"] = args["instance_ids"]
-    if args.get("filters"):
-        action_args["filters"] = args["filters"]
-    if args.get("az"):
-        action_args["az"] = args["az"]
-    
-    # EC2 action
-    actions = [ActionConfig(
-        name=args["action_type"],
-        module="chaosaws.ec2.actions",
-        func=args["action_type"],
-        arguments=action_args
-    )]
-    
-    experiment = generate_experiment_json(config, [], actions, [])
-    
-    # Write to file
-    output_file = args.get("output_file", "./ec2-chaos-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated EC2 {args['action_type']} experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.communicate()
+        raise
+    return proc.returncode, stdout.decode(), stderr.decode()
 
 
 async def run_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -1005,19 +1167,13 @@ async def run_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     cwd = args.get("working_directory", os.getcwd())
     
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1 hour timeout
-        )
-        
-        output = f"Exit code: {result.returncode}\n\nSTDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
-        
+        returncode, stdout, stderr = await _run_chaos(cmd, cwd=cwd, timeout=3600)
+
+        output = f"Exit code: {returncode}\n\nSTDOUT:\n{stdout}\n\nSTDERR:\n{stderr}"
+
         return [{"type": "text", "text": output}]
-        
-    except subprocess.TimeoutExpired:
+
+    except asyncio.TimeoutError:
         return [{"type": "text", "text": "Error: Experiment execution timed out after 1 hour"}]
     except Exception as e:
         return [{"type": "text", "text": f"Error running experiment: {str(e)}"}]
@@ -1031,183 +1187,244 @@ async def validate_experiment(args: Dict[str, Any]) -> List[Dict[str, Any]]:
         return [{"type": "text", "text": f"Error: Experiment file not found: {experiment_file}"}]
     
     try:
-        result = subprocess.run(
-            ["chaos", "validate", experiment_file],
-            capture_output=True,
-            text=True,
-            timeout=60
+        returncode, stdout, stderr = await _run_chaos(
+            ["chaos", "validate", experiment_file], timeout=60
         )
-        
-        output = f"Validation result: {'PASSED' if result.returncode == 0 else 'FAILED'}\n\n{result.stdout}\n{result.stderr}"
-        
+
+        output = f"Validation result: {'PASSED' if returncode == 0 else 'FAILED'}\n\n{stdout}\n{stderr}"
+
         return [{"type": "text", "text": output}]
-        
+
     except Exception as e:
         return [{"type": "text", "text": f"Error validating experiment: {str(e)}"}]
 
 
+# Cap on concurrent per-file rollback retries, so a large batch cannot
+# overwhelm the AWS APIs behind recover_az.
+_ROLLBACK_CONCURRENCY = 4
+
+# State files follow the fail_az dotted naming convention
+# (fail_az.ec2.json / fail_az.asg.json); one compiled pass over the
+# basename picks the recover module instead of per-kind substring scans.
+_KIND_RE = re.compile(r"(?:^|[._-])(ec2|asg)(?:[._-]|$)")
+_MODULE_BY_KIND = {
+    "ec2": "azchaosaws.ec2.actions",
+    "asg": "azchaosaws.asg.actions",
+}
+
+
+async def _rollback_one(
+    state_file: str, module: str, cwd: str, semaphore: asyncio.Semaphore
+) -> List[str]:
+    """Run a single-file recover experiment, returning result lines"""
+    import tempfile
+
+    async with semaphore:
+        rollback_experiment = {
+            "version": "1.0.0",
+            "title": f"Rollback from {state_file}",
+            "description": "Automated rollback",
+            "method": [
+                {
+                    "type": _TYPE_ACTION,
+                    "name": "recover_az",
+                    "provider": _mk_provider(
+                        module, "recover_az", {"state_path": state_file}
+                    )
+                }
+            ]
+        }
+
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+            f.write(_encode_experiment(rollback_experiment))
+            temp_file = f.name
+
+        try:
+            returncode, stdout, stderr = await _run_chaos(
+                ["chaos", "run", temp_file], cwd=cwd, timeout=600
+            )
+        finally:
+            os.unlink(temp_file)
+
+        lines = [f"Rollback from {state_file}: {'SUCCESS' if returncode == 0 else 'FAILED'}"]
+        if stdout:
+            lines.append(f"Output: {stdout}")
+        if stderr:
+            lines.append(f"Errors: {stderr}")
+        return lines
+
+
 async def rollback_from_state(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Execute rollback using state files"""
     
     state_files = args["state_files"]
     cwd = args.get("working_directory", os.getcwd())
     
+    # Only the rollback path needs tempfile; import it here so server
+    # startup and the generation handlers never pay for it.
+    import tempfile
+
     results = []
-    
-    for state_file in state_files:
-        if not os.path.exists(state_file):
+
+    # Collect every recover action into one composite experiment so a
+    # single chaos run covers all state files, amortizing the process
+    # startup cost that dominates short rollbacks.
+    method = []
+    rolled_back = []
+
+    for index, state_file in enumerate(state_files):
+        # One stat syscall per file; os.path.exists would issue the same
+        # stat and throw away the result before chaos re-opens the file.
+        try:
+            os.stat(state_file)
+        except OSError:
             results.append(f"Warning: State file not found: {state_file}")
             continue
-        
+
+        # Determine rollback action based on state file name
+        match = _KIND_RE.search(os.path.basename(state_file))
+        if match is None:
+            results.append(f"Warning: Unknown state file type: {state_file}")
+            continue
+        module = _MODULE_BY_KIND[match.group(1)]
+
+        method.append({
+            "type": _TYPE_ACTION,
+            "name": f"recover_az_{index}",
+            "provider": _mk_provider(
+                module, "recover_az", {"state_path": state_file}
+            )
+        })
+        rolled_back.append((state_file, module))
+
+    if method:
         try:
-            # Determine rollback action based on state file name
-            if "ec2" in state_file:
-                module = "azchaosaws.ec2.actions"
-            elif "asg" in state_file:
-                module = "azchaosaws.asg.actions"
-            else:
-                results.append(f"Warning: Unknown state file type: {state_file}")
-                continue
-            
             # Create temporary rollback experiment
             rollback_experiment = {
                 "version": "1.0.0",
-                "title": f"Rollback from {state_file}",
+                "title": f"Rollback from {len(rolled_back)} state file(s)",
                 "description": "Automated rollback",
-                "method": [
-                    {
-                        "type": "action",
-                        "name": "recover_az",
-                        "provider": {
-                            "type": "python",
-                            "module": module,
-                            "func": "recover_az",
-                            "arguments": {
-                                "state_path": state_file
-                            }
-                        }
-                    }
-                ]
+                "method": method
             }
-            
+
             # Write temporary experiment file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(rollback_experiment, f, indent=2)
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+                f.write(_encode_experiment(rollback_experiment))
                 temp_file = f.name
-            
+
             try:
-                result = subprocess.run(
+                # One 600s budget per state file, spent in a single run.
+                returncode, stdout, stderr = await _run_chaos(
                     ["chaos", "run", temp_file],
                     cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600  # 10 minutes timeout
+                    timeout=600 * len(method)
                 )
-                
-                results.append(f"Rollback from {state_file}: {'SUCCESS' if result.returncode == 0 else 'FAILED'}")
-                if result.stdout:
-                    results.append(f"Output: {result.stdout}")
-                if result.stderr:
-                    results.append(f"Errors: {result.stderr}")
-                    
+
+                if returncode == 0:
+                    for state_file, _ in rolled_back:
+                        results.append(f"Rollback from {state_file}: SUCCESS")
+                    if stdout:
+                        results.append(f"Output: {stdout}")
+                    if stderr:
+                        results.append(f"Errors: {stderr}")
+                else:
+                    # The batch run failed as a unit; retry each state
+                    # file in its own run, concurrently but bounded.
+                    results.append("Batch rollback FAILED; retrying state files individually")
+                    if stderr:
+                        results.append(f"Errors: {stderr}")
+
+                    semaphore = asyncio.Semaphore(_ROLLBACK_CONCURRENCY)
+                    retries = await asyncio.gather(
+                        *[
+                            _rollback_one(state_file, module, cwd, semaphore)
+                            for state_file, module in rolled_back
+                        ],
+                        return_exceptions=True
+                    )
+                    for (state_file, _), outcome in zip(rolled_back, retries):
+                        if isinstance(outcome, BaseException):
+                            results.append(f"Error rolling back {state_file}: {outcome}")
+                        else:
+                            results.extend(outcome)
+
             finally:
                 os.unlink(temp_file)
-                
+
         except Exception as e:
-            results.append(f"Error rolling back {state_file}: {str(e)}")
-    
+            files = ', '.join(state_file for state_file, _ in rolled_back)
+            results.append(f"Error rolling back {files}: {str(e)}")
+
     return [{"type": "text", "text": "\n".join(results)}]
 
 
 
-async def generate_generic_experiment(args: Dict[str, Any], module: str, func: str) -> List[Dict[str, Any]]:
-    """Generate a generic chaos experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"{func} experiment",
-        aws_region=args.get("aws_region", "us-east-1")
-    )
-    
-    # Build action arguments by excluding meta fields
-    action_args = {k: v for k, v in args.items() 
-                   if k not in ["title", "output_file", "aws_region"]}
-    
-    # Create action
-    actions = [ActionConfig(
-        name=func,
-        module=module,
-        func=func,
-        arguments=action_args
-    )]
-    
-    experiment = generate_experiment_json(config, [], actions, [])
-    
-    # Write to file
-    output_file = args.get("output_file", f"./{func}-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated {func} experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+# O(1) tool dispatch: tool name -> (handler, extra_args). Entries with
+# extra_args route through a shared handler that takes the chaosaws
+# module/function pair (or stress type) as positional arguments.
+_DISPATCH = {
+    # AZ Failure Tools
+    "chaos_generate_az_failure_experiment": (generate_az_failure_experiment, None),
+    "chaos_generate_asg_az_failure_experiment": (generate_asg_az_failure_experiment, None),
+    "chaos_isolate_az_network": (generate_generic_experiment, ("azchaosaws.ec2.actions", "isolate_az_network")),
+    "chaos_simulate_az_partition": (generate_generic_experiment, ("azchaosaws.ec2.actions", "simulate_az_partition")),
+    # EC2 Chaos Tools
+    "chaos_stop_instances": (generate_generic_experiment, ("chaosaws.ec2.actions", "stop_instances")),
+    "chaos_terminate_instances": (generate_generic_experiment, ("chaosaws.ec2.actions", "terminate_instances")),
+    "chaos_reboot_instances": (generate_generic_experiment, ("chaosaws.ec2.actions", "reboot_instances")),
+    "chaos_detach_volumes": (generate_generic_experiment, ("chaosaws.ec2.actions", "detach_volumes")),
+    # ASG Chaos Tools
+    "chaos_suspend_asg_processes": (generate_generic_experiment, ("chaosaws.asg.actions", "suspend_processes")),
+    "chaos_terminate_random_instances": (generate_generic_experiment, ("chaosaws.asg.actions", "terminate_random_instances")),
+    # SSM Chaos Tools
+    "chaos_ssm_send_command": (generate_generic_experiment, ("chaosaws.ssm.actions", "send_command")),
+    "chaos_ssm_stress_cpu": (generate_ssm_stress_experiment, ("cpu",)),
+    "chaos_ssm_fill_disk": (generate_ssm_stress_experiment, ("disk",)),
+    "chaos_ssm_kill_process": (generate_generic_experiment, ("chaosaws.ssm.actions", "kill_process")),
+    # Network Chaos Tools
+    "chaos_modify_security_groups": (generate_generic_experiment, ("chaosaws.ec2.actions", "modify_security_groups")),
+    "chaos_simulate_network_latency": (generate_generic_experiment, ("chaosaws.ec2.actions", "simulate_network_latency")),
+    # RDS Chaos Tools
+    "chaos_reboot_db_instance": (generate_generic_experiment, ("chaosaws.rds.actions", "reboot_db_instance")),
+    "chaos_failover_db_cluster": (generate_generic_experiment, ("chaosaws.rds.actions", "failover_db_cluster")),
+    # Load Balancer Chaos Tools
+    "chaos_deregister_targets": (generate_generic_experiment, ("chaosaws.elbv2.actions", "deregister_targets")),
+    # Original Tools
+    "chaos_generate_ec2_actions_experiment": (generate_ec2_actions_experiment, None),
+    "chaos_run_experiment": (run_experiment, None),
+    "chaos_validate_experiment": (validate_experiment, None),
+    "chaos_rollback_from_state": (rollback_from_state, None),
+    # Batch Tool
+    "chaos_generate_batch": (generate_batch, None),
+}
 
+# Intern the dispatch keys so lookups against interned incoming names
+# hit the pointer-comparison fast path instead of full string hashing.
+_DISPATCH = {sys.intern(key): value for key, value in _DISPATCH.items()}
 
-async def generate_ssm_stress_experiment(args: Dict[str, Any], stress_type: str) -> List[Dict[str, Any]]:
-    """Generate SSM stress experiment"""
-    
-    config = ExperimentConfig(
-        title=args["title"],
-        description=f"SSM {stress_type} stress experiment",
-        aws_region=args.get("aws_region", "us-east-1")
-    )
-    
-    # Build stress command based on type
-    if stress_type == "cpu":
-        commands = [f"stress --cpu {args.get('cpu_cores', 2)} --timeout {args.get('duration_seconds', 300)}s"]
-    elif stress_type == "disk":
-        size_mb = args.get('size_mb', 1024)
-        duration = args.get('duration_seconds', 600)
-        path = args.get('path', '/tmp')
-        commands = [
-            f"dd if=/dev/zero of={path}/chaos_fill bs=1M count={size_mb}",
-            f"sleep {duration}",
-            f"rm -f {path}/chaos_fill"
-        ]
-    else:
-        commands = ["echo 'Unknown stress type'"]
-    
-    # Create SSM action
-    actions = [ActionConfig(
-        name=f"ssm_{stress_type}_stress",
-        module="chaosaws.ssm.actions",
-        func="send_command",
-        arguments={
-            "instance_ids": args["instance_ids"],
-            "document_name": "AWS-RunShellScript",
-            "parameters": {
-                "commands": commands
-            }
-        }
-    )]
-    
-    experiment = generate_experiment_json(config, [], actions, [])
-    
-    # Write to file
-    output_file = args.get("output_file", f"./ssm-{stress_type}-stress-experiment.json")
-    with open(output_file, "w") as f:
-        json.dump(experiment, f, indent=2)
-    
-    return [{
-        "type": "text",
-        "text": f"Generated SSM {stress_type} stress experiment: {output_file}\n\nExperiment preview:\n{json.dumps(experiment, indent=2)}"
-    }]
+# Tools generate_batch may fan out to: the experiment generators only,
+# so a batch cannot smuggle in an execution or rollback run.
+_GENERATION_HANDLERS = frozenset({
+    generate_az_failure_experiment,
+    generate_asg_az_failure_experiment,
+    generate_ec2_actions_experiment,
+    generate_generic_experiment,
+    generate_ssm_stress_experiment,
+})
+_GENERATION_TOOLS = frozenset(
+    name for name, (handler, _) in _DISPATCH.items()
+    if handler in _GENERATION_HANDLERS
+)
 
 
 def main():
     """Main entry point"""
-    import asyncio
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:  # optional speedup, default loop works fine
+        pass
+
     asyncio.run(stdio_server(server))
 
 
@@ -1,28 +1,128 @@
 """Tests for the Chaos Toolkit AWS MCP Server"""
 
-import json
+import os
+import shutil
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import AsyncMock, patch
 
+import msgspec
+import orjson
 import pytest
 
+# Only the cheap config models are imported eagerly; the generator and
+# validation handlers come from the session-scoped server_mod fixture so
+# collection does not resolve them per test module.
 from chaostoolkit_aws_mcp_server.server import (
     ActionConfig,
     ExperimentConfig,
     ProbeConfig,
-    generate_experiment_json,
-    generate_az_failure_experiment,
-    generate_asg_az_failure_experiment,
-    generate_ec2_actions_experiment,
-    validate_experiment,
 )
 
 
+@pytest.fixture(scope="session")
+def server_mod():
+    """The server module, resolved once per session"""
+    import chaostoolkit_aws_mcp_server.server as module
+    return module
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """One output directory shared by the generation tests
+
+    Each test writes a distinctly-named file, so a single session-scoped
+    directory avoids the per-test mkdir/cleanup-walk of
+    tempfile.TemporaryDirectory. The directory lives on tmpfs
+    (/dev/shm) when the host provides it, keeping the write/read
+    round-trips of the generation tests off the disk entirely.
+    """
+    if os.path.isdir("/dev/shm"):
+        shm_dir = Path(tempfile.mkdtemp(prefix="experiments-", dir="/dev/shm"))
+        yield shm_dir
+        shutil.rmtree(shm_dir, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("experiments")
+
+
+# The (returncode, stdout, stderr) result every successful mocked chaos
+# run returns; one shared tuple instead of a fresh object per patch.
+_OK_RUN = (0, "Valid", "")
+
+# Minimal valid experiment document, encoded once at import time.
+_VALID_EXP_BYTES = orjson.dumps({"title": "Test", "method": []})
+
+# Base generator arguments, frozen at module scope; each test overlays
+# its output_file (and _debug) with a single dict merge instead of
+# rebuilding the literals per run.
+_AZ_ARGS = MappingProxyType({
+    "title": "AZ Failure Test",
+    "az": "us-east-1a",
+    "failure_type": "network",
+    "dry_run": False,
+    "health_check_url": "http://test.com/health",
+    "state_path": "./test_fail_az.ec2.json",
+    "aws_region": "us-east-1"
+})
+
+_ASG_ARGS = MappingProxyType({
+    "title": "ASG AZ Failure Test",
+    "az": "us-east-1a",
+    "asg_tags": [{"Key": "Environment", "Value": "test"}],
+    "dry_run": True,
+    "aws_region": "us-west-2"
+})
+
+_EC2_ARGS = MappingProxyType({
+    "title": "EC2 Stop Test",
+    "action_type": "stop_instances",
+    "instance_ids": ["i-1234567890abcdef0"],
+    "az": "us-east-1a",
+    "aws_region": "us-east-1"
+})
+
+
+# The generated-experiment shape check, compiled once at import time as
+# a flat function so the parametrized test runs one straight-line
+# bytecode object instead of four interpreted attribute-walk asserts.
+_ns: dict = {}
+exec(
+    compile(
+        "def _check_experiment(experiment, title, region, module, func):\n"
+        "    provider = experiment['method'][0]['provider']\n"
+        "    assert experiment['title'] == title\n"
+        "    assert experiment['configuration']['aws_region'] == region\n"
+        "    assert len(experiment['method']) == 1\n"
+        "    assert provider['module'] == module\n"
+        "    assert provider['func'] == func\n",
+        "<experiment-check>",
+        "exec",
+    ),
+    _ns,
+)
+_check_experiment = _ns["_check_experiment"]
+
+
+@pytest.fixture(scope="class")
+def mock_run_chaos():
+    """Patch _run_chaos once per class with a successful run result
+
+    Scoping the patch avoids mock's per-test patch/unpatch bookkeeping;
+    tests that need call assertions take the fixture explicitly.
+    """
+    with patch(
+        'chaostoolkit_aws_mcp_server.server._run_chaos',
+        new_callable=AsyncMock,
+    ) as mock_run:
+        mock_run.return_value = _OK_RUN
+        yield mock_run
+
+
 class TestExperimentGeneration:
     """Test experiment generation functions"""
 
-    def test_generate_experiment_json(self):
+    def test_generate_experiment_json(self, server_mod):
         """Test basic experiment JSON generation"""
         config = ExperimentConfig(
             title="Test Experiment",
@@ -51,176 +151,159 @@ class TestExperimentGeneration:
             arguments={"arg3": "value3"}
         )]
         
-        result = generate_experiment_json(config, probes, actions, rollbacks)
-        
-        assert result["title"] == "Test Experiment"
-        assert result["description"] == "Test description"
-        assert result["configuration"]["aws_region"] == "us-east-1"
-        assert len(result["steady-state-hypothesis"]["probes"]) == 1
-        assert len(result["method"]) == 1
-        assert len(result["rollbacks"]) == 1
-
-    @pytest.mark.asyncio
-    async def test_generate_az_failure_experiment(self):
-        """Test AZ failure experiment generation"""
-        args = {
-            "title": "AZ Failure Test",
-            "az": "us-east-1a",
-            "failure_type": "network",
-            "dry_run": False,
-            "health_check_url": "http://test.com/health",
-            "state_path": "./test_fail_az.ec2.json",
-            "output_file": "./test_az_experiment.json",
-            "aws_region": "us-east-1"
-        }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test_az_experiment.json"
-            args["output_file"] = str(output_file)
-            
-            result = await generate_az_failure_experiment(args)
-            
-            assert len(result) == 1
-            assert "Generated AZ failure experiment" in result[0]["text"]
-            assert output_file.exists()
-            
-            # Verify the generated experiment file
-            with open(output_file) as f:
-                experiment = json.load(f)
-            
-            assert experiment["title"] == "AZ Failure Test"
-            assert experiment["configuration"]["aws_region"] == "us-east-1"
-            assert len(experiment["method"]) == 1
-            assert experiment["method"][0]["provider"]["module"] == "azchaosaws.ec2.actions"
-            assert experiment["method"][0]["provider"]["func"] == "fail_az"
-
-    @pytest.mark.asyncio
-    async def test_generate_asg_az_failure_experiment(self):
-        """Test ASG AZ failure experiment generation"""
-        args = {
-            "title": "ASG AZ Failure Test",
-            "az": "us-east-1a",
-            "asg_tags": [{"Key": "Environment", "Value": "test"}],
-            "dry_run": True,
-            "output_file": "./test_asg_experiment.json",
-            "aws_region": "us-west-2"
-        }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test_asg_experiment.json"
-            args["output_file"] = str(output_file)
-            
-            result = await generate_asg_az_failure_experiment(args)
-            
-            assert len(result) == 1
-            assert "Generated ASG AZ failure experiment" in result[0]["text"]
-            assert output_file.exists()
-            
-            # Verify the generated experiment file
-            with open(output_file) as f:
-                experiment = json.load(f)
-            
-            assert experiment["title"] == "ASG AZ Failure Test"
-            assert experiment["configuration"]["aws_region"] == "us-west-2"
-            assert experiment["method"][0]["provider"]["module"] == "azchaosaws.asg.actions"
-
-    @pytest.mark.asyncio
-    async def test_generate_ec2_actions_experiment(self):
-        """Test EC2 actions experiment generation"""
-        args = {
-            "title": "EC2 Stop Test",
-            "action_type": "stop_instances",
-            "instance_ids": ["i-1234567890abcdef0"],
-            "az": "us-east-1a",
-            "output_file": "./test_ec2_experiment.json",
-            "aws_region": "us-east-1"
+        result = server_mod.generate_experiment_json(config, probes, actions, rollbacks)
+
+        # Project the scalar fields and compare once via dict __eq__.
+        expected = {
+            "title": "Test Experiment",
+            "description": "Test description",
+            "configuration": {"aws_region": "us-east-1"}
         }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test_ec2_experiment.json"
-            args["output_file"] = str(output_file)
-            
-            result = await generate_ec2_actions_experiment(args)
-            
-            assert len(result) == 1
-            assert "Generated EC2 stop_instances experiment" in result[0]["text"]
-            assert output_file.exists()
-            
-            # Verify the generated experiment file
-            with open(output_file) as f:
-                experiment = json.load(f)
-            
-            assert experiment["title"] == "EC2 Stop Test"
-            assert experiment["method"][0]["provider"]["module"] == "chaosaws.ec2.actions"
-            assert experiment["method"][0]["provider"]["func"] == "stop_instances"
-
-    @pytest.mark.asyncio
-    async def test_validate_experiment_success(self):
+        assert {k: result[k] for k in expected} == expected
+        assert (
+            len(result["steady-state-hypothesis"]["probes"]),
+            len(result["method"]),
+            len(result["rollbacks"]),
+        ) == (1, 1, 1)
+
+    # One parametrized test covers the three generators, so the trivial
+    # coroutine bodies share a single session-scoped event loop instead
+    # of paying loop create/close per test.
+    @pytest.mark.parametrize(
+        "generator_name,base_args,label,expected",
+        [
+            pytest.param(
+                "generate_az_failure_experiment",
+                _AZ_ARGS,
+                "Generated AZ failure experiment",
+                ("AZ Failure Test", "us-east-1", "azchaosaws.ec2.actions", "fail_az"),
+                id="az-failure",
+            ),
+            pytest.param(
+                "generate_asg_az_failure_experiment",
+                _ASG_ARGS,
+                "Generated ASG AZ failure experiment",
+                ("ASG AZ Failure Test", "us-west-2", "azchaosaws.asg.actions", "fail_az"),
+                id="asg-az-failure",
+            ),
+            pytest.param(
+                "generate_ec2_actions_experiment",
+                _EC2_ARGS,
+                "Generated EC2 stop_instances experiment",
+                ("EC2 Stop Test", "us-east-1", "chaosaws.ec2.actions", "stop_instances"),
+                id="ec2-actions",
+            ),
+        ],
+    )
+    async def test_generate_experiment_variants(
+        self, shared_tmp, server_mod, generator_name, base_args, label, expected
+    ):
+        """Test experiment generation across the generator variants"""
+        title, region, module, func = expected
+        generator = getattr(server_mod, generator_name)
+        output_file = shared_tmp / f"{generator_name}.json"
+        args = {**base_args, "output_file": str(output_file), "_debug": True}
+
+        result = await generator(args)
+
+        assert len(result) == 1
+        # Responses lead with the label, so a C-level prefix check
+        # replaces the substring scan.
+        assert result[0]["text"].startswith(label)
+        assert output_file.exists()
+
+        # Verify the built experiment from the debug slot rather than
+        # reparsing the file; test_generated_file_roundtrip covers disk.
+        _check_experiment(result[0]["_experiment"], title, region, module, func)
+
+    async def test_generated_file_roundtrip(self, shared_tmp, server_mod):
+        """Test that the written experiment file matches the document"""
+        output_file = shared_tmp / "test_roundtrip_experiment.json"
+        args = {**_AZ_ARGS, "output_file": str(output_file), "_debug": True}
+
+        result = await server_mod.generate_az_failure_experiment(args)
+
+        experiment = orjson.loads(output_file.read_bytes())
+        assert experiment == result[0]["_experiment"]
+
+    async def test_validate_experiment_success(self, mock_run_chaos, server_mod, tmp_path):
         """Test successful experiment validation"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"title": "Test", "method": []}, f)
-            experiment_file = f.name
-        
-        try:
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0, stdout="Valid", stderr="")
-                
-                result = await validate_experiment({"experiment_file": experiment_file})
-                
-                assert len(result) == 1
-                assert "PASSED" in result[0]["text"]
-                mock_run.assert_called_once()
-        finally:
-            Path(experiment_file).unlink()
-
-    @pytest.mark.asyncio
-    async def test_validate_experiment_file_not_found(self):
+        experiment_file = tmp_path / "exp.json"
+        experiment_file.write_bytes(_VALID_EXP_BYTES)
+
+        result = await server_mod.validate_experiment(
+            {"experiment_file": str(experiment_file)}
+        )
+
+        assert len(result) == 1
+        assert "PASSED" in result[0]["text"]
+        mock_run_chaos.assert_called_once()
+
+    async def test_validate_experiment_file_not_found(self, server_mod):
         """Test validation with non-existent file"""
-        result = await validate_experiment({"experiment_file": "./nonexistent.json"})
+        result = await server_mod.validate_experiment(
+            {"experiment_file": "./nonexistent.json"}
+        )
         
         assert len(result) == 1
         assert "Error: Experiment file not found" in result[0]["text"]
 
 
+# The config-model tests only read these instances, so build each one
+# once per module instead of per test.
+@pytest.fixture(scope="module")
+def sample_probe():
+    return ProbeConfig(
+        name="test_probe",
+        module="test.module",
+        func="test_func",
+        arguments={"key": "value"}
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_action():
+    return ActionConfig(
+        name="test_action",
+        module="test.module",
+        func="test_func",
+        arguments={"key": "value"}
+    )
+
+
 class TestConfigModels:
     """Test configuration models"""
 
     def test_experiment_config_defaults(self):
         """Test ExperimentConfig with defaults"""
         config = ExperimentConfig(title="Test")
-        
-        assert config.title == "Test"
-        assert config.description == ""
-        assert config.aws_region == "us-east-1"
-        assert config.tags == []
 
-    def test_probe_config(self):
+        # One whole-value comparison instead of per-field asserts; the
+        # failure diff then shows every deviating field at once.
+        assert msgspec.to_builtins(config) == {
+            "title": "Test",
+            "description": "",
+            "aws_region": "us-east-1",
+            "tags": []
+        }
+
+    def test_probe_config(self, sample_probe):
         """Test ProbeConfig"""
-        probe = ProbeConfig(
-            name="test_probe",
-            module="test.module",
-            func="test_func",
-            arguments={"key": "value"}
-        )
-        
-        assert probe.name == "test_probe"
-        assert probe.type == "probe"
-        assert probe.module == "test.module"
-        assert probe.func == "test_func"
-        assert probe.arguments == {"key": "value"}
-        assert probe.tolerance is True
-
-    def test_action_config(self):
+        assert msgspec.to_builtins(sample_probe) == {
+            "name": "test_probe",
+            "type": "probe",
+            "module": "test.module",
+            "func": "test_func",
+            "arguments": {"key": "value"},
+            "tolerance": True
+        }
+
+    def test_action_config(self, sample_action):
         """Test ActionConfig"""
-        action = ActionConfig(
-            name="test_action",
-            module="test.module",
-            func="test_func",
-            arguments={"key": "value"}
-        )
-        
-        assert action.name == "test_action"
-        assert action.type == "action"
-        assert action.module == "test.module"
-        assert action.func == "test_func"
-        assert action.arguments == {"key": "value"}
+        assert msgspec.to_builtins(sample_action) == {
+            "name": "test_action",
+            "type": "action",
+            "module": "test.module",
+            "func": "test_func",
+            "arguments": {"key": "value"}
+        }